@@ -204,7 +204,7 @@ class Application:
 
         cwd = Path.cwd()
 
-        for project in self.repository.projects():
+        for project in self.repository.projects:
             path = project.directory.resolve()
             if path == cwd:
                 return project
@@ -215,8 +215,8 @@ class Application:
         """Return a list of all configuration objects, i.e. all projects and eventually the #Repository, unless one
         project is from the same directory as the repository."""
 
-        result: list[Configuration] = list(self.get_target_projects() if targets_only else self.repository.projects())
-        if self.repository.directory not in tuple(p.directory for p in self.repository.projects()):
+        result: list[Configuration] = list(self.get_target_projects() if targets_only else self.repository.projects)
+        if self.repository.directory not in tuple(p.directory for p in self.repository.projects):
             result.insert(0, self.repository)
         return result
 
@@ -272,10 +272,11 @@ class Application:
             only_projects = split_by_commata(only_projects)
 
         if only_projects is not None:
+            resolved_directories = [(p, p.directory.resolve()) for p in self.repository.projects]
             projects: list[Project] = []
             for only_project in only_projects:
                 project_path = (cwd / only_project).resolve()
-                matching_projects = [p for p in self.repository.projects() if p.directory.resolve() == project_path]
+                matching_projects = [p for p, path in resolved_directories if path == project_path]
                 if not matching_projects:
                     raise ValueError(f'error: "{only_project}" does not point to a project')
                 projects += matching_projects
@@ -34,14 +34,14 @@ DEFAULT_VALID_TYPES = [
 
 def get_default_author(app: Application) -> str | None:
     username: str | None = None
-    if remote := app.repository.host():
+    if remote := app.repository.host:
         try:
             username = remote.get_username(app.repository)
         except Exception as exc:
             logger.warning(
                 f"unable to fetch GitHub username, falling back to configured email address. (reason: {exc})"
             )
-    if username is None and (vcs := app.repository.vcs()):
+    if username is None and (vcs := app.repository.vcs):
         username = vcs.get_author().email
     return username
 
@@ -170,7 +170,7 @@ class ChangelogAddCommand(BaseChangelogCommand):
             self.line_error("error: cannot add changelog because the feature must be enabled in the config", "error")
             return 1
 
-        vcs = self.app.repository.vcs()
+        vcs = self.app.repository.vcs
         change_type: str | None = self.option("type")
         description: str | None = self.option("description")
         author: str | None = self.option("author") or get_default_author(self.app)
@@ -291,7 +291,7 @@ class ChangelogDiffBaseCommand(Command):
         else:
             self.ref_range = f"{self.base_ref}..{self.head_ref}"
 
-        vcs = self.app.repository.vcs()
+        vcs = self.app.repository.vcs
         if not vcs:
             self.line_error("VCS is not configured or could not be detected", "error")
             sys.exit(1)
@@ -585,7 +585,7 @@ class ChangelogConvertCommand(BaseChangelogCommand):
     def handle(self) -> int:
         import yaml
 
-        # vcs = self.app.repository.vcs()
+        # vcs = self.app.repository.vcs
         author = self.option("author") or get_default_author(self.app)
 
         if not author:
@@ -690,7 +690,7 @@ def get_changelog_manager(repository: Repository, project: Project | None) -> Ch
 
     return ChangelogManager(
         directory=(project or repository).directory / config.directory,
-        repository_host=repository.host(),
+        repository_host=repository.host,
         valid_types=config.valid_types,
         readonly=not config.enabled,
     )
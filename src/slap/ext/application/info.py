@@ -33,8 +33,8 @@ class InfoCommandPlugin(Command, ApplicationPlugin):
         projects = self.app.repository.get_projects_ordered()
 
         self.line(f'Repository <s>"{self.app.repository.directory}"</s>')
-        self.line(f"  vcs: <opt>{self.app.repository.vcs()}</opt>")
-        self.line(f"  host: <opt>{self.app.repository.host()}</opt>")
+        self.line(f"  vcs: <opt>{self.app.repository.vcs}</opt>")
+        self.line(f"  host: <opt>{self.app.repository.host}</opt>")
         self.line(f"  projects: <opt>{[p.id for p in projects]}</opt>")
 
         for project in projects:
@@ -129,11 +129,14 @@ class InitCommandPlugin(Command, ApplicationPlugin):
                 if self.option("license") in ("null", "none"):
                     continue
                 content = get_spdx_license_details(self.option("license")).license_text
-                content = wrap_license_text(content).replace("<year>", str(scope["year"]))
-                content = wrap_license_text(content).replace("<copyright holders>", scope["author_name"])
+                content = (
+                    wrap_license_text(content)
+                    .replace("<year>", str(scope["year"]))
+                    .replace("<copyright holders>", scope["author_name"])
+                )
             else:
-                filename = filename.format(**scope)
-                content = textwrap.dedent(content.format(**scope)).strip()
+                filename = filename.format_map(scope)
+                content = textwrap.dedent(content.format_map(scope)).strip()
                 if content:
                     content += "\n"
 
@@ -203,7 +203,7 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
         # interdependencies between the projects.
         projects_plus_dependencies = (
             Stream(projects)
-            .map(lambda p: p.get_interdependencies(self.app.repository.projects(), recursive=True))
+            .map(lambda p: p.get_interdependencies(self.app.repository.projects, recursive=True))
             .concat()
             .append(projects)
             .distinct()
@@ -149,7 +149,7 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
         import databind.json
 
         result = {}
-        for project in t.cast(list[Configuration], [app.repository] + app.repository.projects()):  # type: ignore[operator]  # noqa: E501
+        for project in t.cast(list[Configuration], [app.repository] + app.repository.projects):  # type: ignore[operator]  # noqa: E501
             data = project.raw_config().get("release", {})
             result[project] = databind.json.load(data, ReleaseConfig)
         self.app = app
@@ -446,10 +446,11 @@ class ReleaseCommandPlugin(Command, ApplicationPlugin):
 
         version_refs.sort(key=lambda r: r.file)
 
+        cwd = Path.cwd()
         for ref in version_refs:
-            if ref.file == ref.file.absolute():
+            if ref.file.is_absolute():
                 try:
-                    ref.file = ref.file.relative_to(Path.cwd())
+                    ref.file = ref.file.relative_to(cwd)
                 except ValueError:
                     pass
 
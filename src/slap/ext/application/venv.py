@@ -12,7 +12,6 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
-from git import TYPE_CHECKING
 from nr.python.environment.virtualenv import VirtualEnvInfo, get_current_venv
 
 from slap.application import Application, Command, argument, option
@@ -119,7 +118,7 @@ class UvVenv(Venv):
 
     @staticmethod
     def find_uv_bin() -> Path:
-        if TYPE_CHECKING:
+        if t.TYPE_CHECKING:
 
             def find_uv_bin() -> str: ...
 
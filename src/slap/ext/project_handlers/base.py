@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 import re
 import typing as t
 from pathlib import Path
@@ -19,6 +20,7 @@ if t.TYPE_CHECKING:
     from slap.python.dependency import Dependency
 
 IGNORED_MODULES = ["test", "tests", "docs", "build"]
+PYPROJECT_TOML_VERSION_PATTERN = re.compile(r'^version\s*=\s*[\'"]?(.*?)[\'"]', re.M | re.S)
 
 
 def detect_packages(directory: Path) -> list[Package]:
@@ -35,25 +37,20 @@ def detect_packages(directory: Path) -> list[Package]:
         if path.is_file() and path.suffix == ".py" and path.stem not in modules:
             modules.append(path.stem)
 
-    # Remove modules that seem to be other Python projects.
-    modules = [m for m in modules if not (directory / m.partition(".")[0] / "pyproject.toml").is_file()]
-
-    if not modules:
-        return []
-
+    # Filter modules in a single pass. Ignored modules are skipped before touching the filesystem, modules that seem
+    # to be other Python projects are removed and the remaining modules are mapped to their file or directory.
     paths = {}
     for module in modules:
+        top_level = module.partition(".")[0]
+        if top_level in IGNORED_MODULES or (directory / top_level / "pyproject.toml").is_file():
+            continue
         tlm_file = directory / (module + ".py")
         pkg_file = directory / Path(*module.split("."), "__init__.py")
         use_file = tlm_file if tlm_file.is_file() else pkg_file.parent if pkg_file.is_file() else None
         if use_file is not None:
             paths[module] = use_file
 
-    modules = [m for m in modules if m in paths]
-
-    modules = [
-        m for m in modules if m not in IGNORED_MODULES and ("." not in m or m.split(".")[0] not in IGNORED_MODULES)
-    ]
+    modules = list(paths)
 
     if len(modules) > 1:
         # If we stil have multiple modules, we try to find the longest common path.
@@ -100,8 +97,7 @@ class PyprojectHandler(BaseProjectHandler):
         interdependencies (you can disable the interdependencies bit by setting `tool.slap.release.interdependencies`
         setting to `False` on the Slap root directory, usually in a `slap.toml` file)."""
 
-        PYPROJECT_TOML_PATTERN = r'^version\s*=\s*[\'"]?(.*?)[\'"]'
-        version_ref = match_version_ref_pattern(project.pyproject_toml.path, PYPROJECT_TOML_PATTERN, None)
+        version_ref = match_version_ref_pattern(project.pyproject_toml.path, PYPROJECT_TOML_VERSION_PATTERN, None)
         refs = [version_ref] if version_ref else []
         if interdependencies_enabled(project):
             refs += get_pyproject_interdependency_version_refs(project)
@@ -178,26 +174,37 @@ def get_pyproject_interdependency_version_refs(project: Project) -> list[Version
     pyproject_file = project.pyproject_toml.path
     other_projects: list[str] = [
         t.cast(str, p.dist_name())
-        for p in project.repository.projects()
+        for p in project.repository.projects
         if p.is_python_project and p is not project and p.dist_name()
     ]
 
+    if not other_projects:
+        return []
+
+    content = pyproject_file.read_text()
     refs = []
+    for name in other_projects:
+        for pattern in _get_pyproject_interdependency_patterns(name):
+            refs += match_version_ref_pattern_on_lines(pyproject_file, pattern, content)
+
+    return refs
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pyproject_interdependency_patterns(name: str) -> tuple[re.Pattern[str], ...]:
+    """Returns the patterns to find version references of the dependency *name* in a `pyproject.toml`. In a
+    mono-repository, the same names are looked up in every project, thus the compiled patterns are cached."""
 
     SELECTOR = r"([\^<>=!~\*]*)(?P<version>\d+\.[\w\d\.\-]+)"
 
-    for name in other_projects:
-        # Look for something that looks like a version number. In common TOML formats, that is usually as an entire
-        # requirement string or as an assignment.
-        expressions = [
-            # This first one matches TOML key/value pairs.
-            r'([\'"])?' + re.escape(name) + r'\1\s*=\s*([\'"])' + SELECTOR + r"\1",
-            re.escape(name) + r'\s*=\s*([\'"])' + SELECTOR + r"\1",
-            # This second one matches a TOML string that contains the dependency.
-            r'([\'"])' + re.escape(name) + r"(?![^\w\d\_\.\-\ ])\s*" + SELECTOR + r"\1\s*($|,|\]|\})",
-        ]
-
-        for expr in expressions:
-            refs += match_version_ref_pattern_on_lines(pyproject_file, expr)
+    # Look for something that looks like a version number. In common TOML formats, that is usually as an entire
+    # requirement string or as an assignment.
+    expressions = [
+        # This first one matches TOML key/value pairs.
+        r'([\'"])?' + re.escape(name) + r'\1\s*=\s*([\'"])' + SELECTOR + r"\1",
+        re.escape(name) + r'\s*=\s*([\'"])' + SELECTOR + r"\1",
+        # This second one matches a TOML string that contains the dependency.
+        r'([\'"])' + re.escape(name) + r"(?![^\w\d\_\.\-\ ])\s*" + SELECTOR + r"\1\s*($|,|\]|\})",
+    ]
 
-    return refs
+    return tuple(re.compile(expr, re.M | re.S) for expr in expressions)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import typing as t
 
@@ -12,6 +13,8 @@ from slap.release import VersionRef, match_version_ref_pattern, match_version_re
 if t.TYPE_CHECKING:
     from slap.python.dependency import VersionSpec
 
+SETUP_CFG_VERSION_PATTERN = re.compile(r"^version\s*=\s*(.*?)$", re.M | re.S)
+
 
 class SetuptoolsProjectHandler(BaseProjectHandler):
     def __init__(self) -> None:
@@ -84,8 +87,7 @@ class SetuptoolsProjectHandler(BaseProjectHandler):
     def get_version_refs(self, project: Project) -> list[VersionRef]:
         """Returns the version reference in `setup.cfg`."""
 
-        VERSION_PATTERN = r"^version\s*=\s*(.*?)$"
-        version_ref = match_version_ref_pattern(project.directory / "setup.cfg", VERSION_PATTERN, None)
+        version_ref = match_version_ref_pattern(project.directory / "setup.cfg", SETUP_CFG_VERSION_PATTERN, None)
         refs = [version_ref] if version_ref else []
         if interdependencies_enabled(project):
             refs += get_setup_cfg_interdependency_version_refs(project)
@@ -115,19 +117,32 @@ def get_setup_cfg_interdependency_version_refs(project: Project) -> list[Version
     setup_cfg = project.directory / "setup.cfg"
     other_projects: list[str] = [
         t.cast(str, p.dist_name())
-        for p in project.repository.projects()
+        for p in project.repository.projects
         if p.is_python_project and p is not project and p.dist_name()
     ]
 
+    if not other_projects:
+        return []
+
+    content = setup_cfg.read_text()
     refs = []
     for project_name in other_projects:
-        # Look for occurrences of the project name in the context of requirements.
-        expressions = [
-            # Match requirements split over multiple lines.
-            r"^\w+_requires?\s*=.*^\s+(?:" + re.escape(project_name) + r"\s*(?:==|>=|<=|>|<)\s*(?P<version>[^\n;]+))",
-            # TODO (@NiklasRosenstein): Also match if the requirements is on the same line
-            # TODO (@NiklasRosenstein): Also match extra requires
-        ]
-        for expr in expressions:
-            refs += match_version_ref_pattern_on_lines(setup_cfg, expr)
+        for pattern in _get_setup_cfg_interdependency_patterns(project_name):
+            refs += match_version_ref_pattern_on_lines(setup_cfg, pattern, content)
     return refs
+
+
+@functools.lru_cache(maxsize=None)
+def _get_setup_cfg_interdependency_patterns(name: str) -> tuple[re.Pattern[str], ...]:
+    """Returns the patterns to find version references of the dependency *name* in a `setup.cfg`. In a
+    mono-repository, the same names are looked up in every project, thus the compiled patterns are cached."""
+
+    # Look for occurrences of the project name in the context of requirements.
+    expressions = [
+        # Match requirements split over multiple lines.
+        r"^\w+_requires?\s*=.*^\s+(?:" + re.escape(name) + r"\s*(?:==|>=|<=|>|<)\s*(?P<version>[^\n;]+))",
+        # TODO (@NiklasRosenstein): Also match if the requirements is on the same line
+        # TODO (@NiklasRosenstein): Also match extra requires
+    ]
+
+    return tuple(re.compile(expr, re.M | re.S) for expr in expressions)
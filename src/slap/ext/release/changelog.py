@@ -15,7 +15,7 @@ class ChangelogReleasePlugin(ReleasePlugin):
     ) -> t.Sequence[Path]:
         changed_files: list[Path] = []
 
-        config_sources: list[Project | None] = [*repository.projects()] if project is None else [project]
+        config_sources: list[Project | None] = [*repository.projects] if project is None else [project]
         if repository.is_monorepo and project is None:
             config_sources.append(None)
 
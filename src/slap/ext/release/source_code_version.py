@@ -1,4 +1,5 @@
 import logging
+import re
 
 from slap.plugins import ReleasePlugin
 from slap.project import Project
@@ -20,7 +21,7 @@ class SourceCodeVersionReferencesPlugin(ReleasePlugin):
     namespace packages.
     """
 
-    VERSION_REGEX = r'^__version__\s*=\s*[\'"]([^\'"]+)[\'"]'
+    VERSION_REGEX = re.compile(r'^__version__\s*=\s*[\'"]([^\'"]+)[\'"]', re.M | re.S)
     FILENAMES = ["__init__.py", "__about__.py", "_version.py", ".py"]
 
     def get_version_refs(self, project: Project) -> list[VersionRef]:
@@ -38,11 +38,13 @@ class DefaultRepositoryHandler(RepositoryHandlerPlugin):
         directory.
     """
 
+    __slots__ = ()
+
     def _get_config(self, repository: Repository) -> DefaultRepositoryConfig:
         import databind.json
 
-        raw_config = repository.raw_config().get("repository", {})
-        raw_config.pop("handler", None)
+        # Copy instead of popping the "handler" key, the raw configuration is cached and shared with the Repository.
+        raw_config = {k: v for k, v in (repository.raw_config().get("repository") or {}).items() if k != "handler"}
         config = databind.json.load(raw_config, DefaultRepositoryConfig)
         return config
 
@@ -64,13 +66,11 @@ class DefaultRepositoryHandler(RepositoryHandlerPlugin):
         return detect_vcs(repository.directory)
 
     def get_repository_host(self, repository: Repository) -> RepositoryHost | None:
-        from slap.util.plugins import iter_entrypoints
-
         config = self._get_config(repository)
         if config.repository_host:
             return config.repository_host
-        for _plugin_name, loader in iter_entrypoints(RepositoryHost):  # type: ignore[type-abstract]
-            if instance := loader().detect_repository_host(repository):
+        for _name, host_type in RepositoryHost.iter_types():
+            if instance := host_type.detect_repository_host(repository):
                 return instance
         return None
 
@@ -65,7 +65,7 @@ class GithubRepositoryHost(RepositoryHost):
         raise ValueError(f"invalid issue URL: {issue_url!r}")
 
     def get_username(self, repository: Repository) -> str | None:
-        vcs = repository.vcs()
+        vcs = repository.vcs
         assert vcs
         email = vcs.get_author().email
         username = github_get_username_from_email(self._get_api_url(), email)
@@ -7,6 +7,8 @@ from slap.plugins import VersionIncrementingRulePlugin
 
 def incrementing_rule(func: t.Callable[[Version], Version]) -> type[VersionIncrementingRulePlugin]:
     class _Incrementor(VersionIncrementingRulePlugin):
+        __slots__ = ()
+
         def increment_version(self, version: Version) -> Version:
             return func(version)
 
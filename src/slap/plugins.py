@@ -44,6 +44,7 @@ class RepositoryHandlerPlugin(abc.ABC):
     """A plugin to provide data and operations on a repository level."""
 
     ENTRYPOINT = "slap.plugins.repository"
+    __slots__ = ()
 
     @abc.abstractmethod
     def matches_repository(self, repository: Repository) -> bool:
@@ -163,6 +164,7 @@ class VersionIncrementingRulePlugin(abc.ABC):
     """
 
     ENTRYPOINT = "slap.plugins.version_incrementing_rule"
+    __slots__ = ()
 
     @abc.abstractmethod
     def increment_version(self, version: Version) -> Version: ...
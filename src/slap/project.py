@@ -164,21 +164,39 @@ class Project(Configuration):
     def get_version_refs(self) -> list[VersionRef]:
         return self.handler().get_version_refs(self)
 
-    def get_interdependencies(self, projects: t.Sequence[Project], recursive: bool = False) -> list[Project]:
-        """Returns the dependencies of this project in the list of other projects. The returned dictionary maps
-        to the project and the dependency constraint. This will only take run dependencies into account."""
+    def get_interdependencies(
+        self, projects: t.Sequence[Project] | t.Mapping[str, Project], recursive: bool = False
+    ) -> list[Project]:
+        """Returns the dependencies of this project in the list of other projects, ordered by their ID. This will
+        only take run dependencies into account. With *recursive*, the dependencies of every project are expanded
+        only once, even if multiple projects depend on it, and this project is never included in the result.
 
-        dependency_names = set()
-        for dep in self.dependencies().run:
-            dependency_names.add(dep.name)
-
-        result = []
-        for project in projects:
-            if project.dist_name() in dependency_names:
-                result.append(project)
-                if recursive:
-                    result += project.get_interdependencies(projects, True)
+        Arguments:
+          projects: The projects to look for dependencies in. To avoid building an index of the projects on every
+            call, a mapping as returned by #get_projects_by_dist_name() may be passed instead.
+          recursive: Whether to include the interdependencies of the dependencies as well.
+        """
 
+        projects_by_dist_name = projects if isinstance(projects, t.Mapping) else get_projects_by_dist_name(projects)
+        dependency_names = {dep.name for dep in self.dependencies().run}
+        direct = sorted(
+            (projects_by_dist_name[name] for name in dependency_names if name in projects_by_dist_name),
+            key=lambda p: p.id,
+        )
+        if not recursive:
+            return direct
+
+        result: list[Project] = []
+        seen: set[Project] = {self}
+
+        def _visit(dependencies: list[Project]) -> None:
+            for project in dependencies:
+                if project not in seen:
+                    seen.add(project)
+                    result.append(project)
+                    _visit(project.get_interdependencies(projects_by_dist_name))
+
+        _visit(direct)
         return result
 
     def add_dependency(self, dependency: Dependency, where: str) -> None:
@@ -196,6 +214,8 @@ class Project(Configuration):
 
         assert isinstance(dependency, Dependency), type(dependency)
         self.handler().add_dependency(self, dependency, where)
+        if self.pyproject_toml.exists():
+            self.pyproject_toml.load(force_reload=True)
         self.raw_config.flush()
         self.dependencies.flush()
 
@@ -218,3 +238,16 @@ class Project(Configuration):
         if shared_venv is None:
             shared_venv = self.repository.use_shared_venv
         return shared_venv
+
+
+def get_projects_by_dist_name(projects: t.Iterable[Project]) -> dict[str, Project]:
+    """Returns a mapping of the distribution name to the project for all *projects* that have one. The mapping can be
+    passed to #Project.get_interdependencies() to resolve the interdependencies of many projects without repeatedly
+    scanning the list of projects."""
+
+    result = {}
+    for project in projects:
+        dist_name = project.dist_name()
+        if dist_name is not None:
+            result[dist_name] = project
+    return result
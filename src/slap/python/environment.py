@@ -22,6 +22,54 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Python code snippets that are executed in the target Python environment to introspect it. They are dedented once
+# here rather than on every call.
+
+_HAS_IMPORTLIB_METADATA_CODE = textwrap.dedent(
+    """
+    try: import importlib_metadata
+    except ImportError: print('false')
+    else: print('true')
+    """
+)
+
+_INTROSPECT_ENVIRONMENT_CODE = textwrap.dedent(
+    """
+    import sys, platform, json, pickle
+    sys.path.append(sys.argv[1])
+    import pep508
+    try: import importlib_metadata as metadata
+    except ImportError: metadata = None
+    print(json.dumps({
+        "executable": sys.executable,
+        "version": sys.version,
+        "version_tuple": sys.version_info[:3],
+        "platform": platform.platform(),
+        "prefix": sys.prefix,
+        "base_prefix": getattr(sys, 'base_prefix', None),
+        "real_prefix": getattr(sys, 'real_prefix', None),
+        "pep508": pep508.Pep508Environment.current().as_json(),
+        "_has_pkg_resources": metadata is not None,
+    }))
+    """
+)
+
+_GET_DISTRIBUTIONS_CODE = textwrap.dedent(
+    """
+    import sys, pickle
+    try: import importlib.metadata as metadata
+    except ImportError: import importlib_metadata as metadata
+    result = []
+    for arg in sys.argv[1:]:
+        try:
+            dist = metadata.distribution(arg)
+        except metadata.PackageNotFoundError:
+            dist = None
+        result.append(dist)
+    sys.stdout.buffer.write(pickle.dumps(result))
+    """
+)
+
 
 @dataclasses.dataclass
 class PythonEnvironment:
@@ -46,13 +94,7 @@ class PythonEnvironment:
         """Checks if the Python environment has the `importlib_metadata` module available."""
 
         if self._has_pkg_resources is None:
-            code = textwrap.dedent(
-                """
-                try: import importlib_metadata
-                except ImportError: print('false')
-                else: print('true')
-                """
-            )
+            code = _HAS_IMPORTLIB_METADATA_CODE
             self._has_pkg_resources = json.loads(sp.check_output([self.executable, "-c", code]).decode())
         return self._has_pkg_resources
 
@@ -76,28 +118,8 @@ class PythonEnvironment:
         # We ensure that the Pep508 module is importable.
         pep508_path = str(Path(pep508.__file__).parent)
 
-        code = textwrap.dedent(
-            f"""
-            import sys, platform, json, pickle
-            sys.path.append({pep508_path!r})
-            import pep508
-            try: import importlib_metadata as metadata
-            except ImportError: metadata = None
-            print(json.dumps({{
-                "executable": sys.executable,
-                "version": sys.version,
-                "version_tuple": sys.version_info[:3],
-                "platform": platform.platform(),
-                "prefix": sys.prefix,
-                "base_prefix": getattr(sys, 'base_prefix', None),
-                "real_prefix": getattr(sys, 'real_prefix', None),
-                "pep508": pep508.Pep508Environment.current().as_json(),
-                "_has_pkg_resources": metadata is not None,
-            }}))
-            """
-        )
-
-        payload = json.loads(sp.check_output(list(python) + ["-c", code]).decode())
+        code = _INTROSPECT_ENVIRONMENT_CODE
+        payload = json.loads(sp.check_output(list(python) + ["-c", code, pep508_path]).decode())
         payload["version_tuple"] = tuple(payload["version_tuple"])
         payload["pep508"] = pep508.Pep508Environment(**payload["pep508"])
         return PythonEnvironment(**payload)
@@ -111,22 +133,7 @@ class PythonEnvironment:
         """Query the details for the given distributions in the Python environment with
         #importlib_metadata.distribution()."""
 
-        code = textwrap.dedent(
-            """
-            import sys, pickle
-            try: import importlib.metadata as metadata
-            except ImportError: import importlib_metadata as metadata
-            result = []
-            for arg in sys.argv[1:]:
-                try:
-                    dist = metadata.distribution(arg)
-                except metadata.PackageNotFoundError:
-                    dist = None
-                result.append(dist)
-            sys.stdout.buffer.write(pickle.dumps(result))
-            """
-        )
-
+        code = _GET_DISTRIBUTIONS_CODE
         keys = list(distributions)
         result = pickle.loads(sp.check_output([self.executable, "-c", code] + keys))
         return dict(zip(keys, result))
@@ -11,24 +11,27 @@ T = t.TypeVar("T")
 
 
 @t.overload
-def match_version_ref_pattern(filename: Path, pattern: str) -> VersionRef: ...
+def match_version_ref_pattern(filename: Path, pattern: str | re.Pattern[str]) -> VersionRef: ...
 
 
 @t.overload
-def match_version_ref_pattern(filename: Path, pattern: str, fallback: T) -> T | VersionRef: ...
+def match_version_ref_pattern(filename: Path, pattern: str | re.Pattern[str], fallback: T) -> T | VersionRef: ...
 
 
-def match_version_ref_pattern(filename: Path, pattern: str, fallback: NotSet | T = NotSet.Value) -> T | VersionRef:
+def match_version_ref_pattern(
+    filename: Path, pattern: str | re.Pattern[str], fallback: NotSet | T = NotSet.Value
+) -> T | VersionRef:
     """Matches a regular expression in the given file and returns the location of the match. The *pattern*
     should contain at least one capturing group. The first capturing group is considered the one that contains
     the version number exactly.
 
     Arguments:
       filename: The file of which the contents will be checked against the pattern.
-      pattern: The regular expression that contains at least one capturing group.
+      pattern: The regular expression that contains at least one capturing group. A string pattern is compiled
+        with the #re.M and #re.S flags, a pre-compiled pattern is used as-is.
     """
 
-    compiled_pattern = re.compile(pattern, re.M | re.S)
+    compiled_pattern = re.compile(pattern, re.M | re.S) if isinstance(pattern, str) else pattern
     if not compiled_pattern.groups:
         raise ValueError(
             f"pattern must contain at least one capturing group (filename: {filename!r}, pattern: {pattern!r})"
@@ -44,13 +47,25 @@ def match_version_ref_pattern(filename: Path, pattern: str, fallback: NotSet | T
     raise ValueError(f"pattern {pattern!r} does not match in file {filename!r}")
 
 
-def match_version_ref_pattern_on_lines(filename: Path, pattern: str) -> list[VersionRef]:
+def match_version_ref_pattern_on_lines(
+    filename: Path, pattern: str | re.Pattern[str], content: str | None = None
+) -> list[VersionRef]:
     """Like #match_version_ref_pattern(), but returns all matches, but matches it on a line-by-line basis. The
-    *pattern* must have a `version` group. The pattern is compiled with #re.M and #re.S flags."""
+    *pattern* must have a `version` group. A string pattern is compiled with #re.M and #re.S flags.
 
-    compiled_pattern = re.compile(pattern, re.M | re.S)
+    Arguments:
+      filename: The file of which the contents will be checked against the pattern.
+      pattern: The regular expression that contains a `version` group. A pre-compiled pattern is used as-is.
+      content: The contents of *filename*, if already read. Useful to avoid reading the same file over and
+        over again when matching multiple patterns against it.
+    """
+
+    if content is None:
+        content = filename.read_text()
+
+    compiled_pattern = re.compile(pattern, re.M | re.S) if isinstance(pattern, str) else pattern
     refs = []
-    for match in re.finditer(compiled_pattern, filename.read_text()):
+    for match in compiled_pattern.finditer(content):
         refs.append(
             VersionRef(
                 file=filename,
@@ -2,21 +2,25 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import functools
+import graphlib
+import heapq
 import typing as t
 from pathlib import Path
 
 from databind.core.settings import Union
 
 from slap.configuration import Configuration
-from slap.util.once import Once
+from slap.plugins import RepositoryHandlerPlugin
+from slap.util.once import once_property
+from slap.util.plugins import iter_entrypoints, load_entrypoint
 
 if t.TYPE_CHECKING:
-    from slap.plugins import RepositoryHandlerPlugin
     from slap.project import Project
     from slap.util.vcs import Vcs
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Issue:
     """Represents an issue."""
 
@@ -25,7 +29,7 @@ class Issue:
     shortform: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class PullRequest:
     """Represents a pull request."""
 
@@ -67,29 +71,56 @@ class RepositoryHost(abc.ABC):
     @abc.abstractmethod
     def detect_repository_host(repository: Repository) -> RepositoryHost | None: ...
 
+    @staticmethod
+    def iter_types() -> t.Iterator[tuple[str, type[RepositoryHost]]]:
+        """Iterates over the registered repository host implementations and their entrypoint names. The entrypoints
+        are scanned only once per process and every implementation is imported only when the iteration reaches it,
+        thus a caller that stops early does not import the remaining plugins."""
+
+        for name, loader in _get_repository_host_loaders():
+            yield name, loader()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_repository_host_loaders() -> tuple[tuple[str, t.Callable[[], type[RepositoryHost]]], ...]:
+    loaders = iter_entrypoints(RepositoryHost)  # type: ignore[type-abstract]
+    return tuple((name, functools.lru_cache(maxsize=None)(loader)) for name, loader in loaders)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_handler_cls(name: str) -> type[RepositoryHandlerPlugin]:
+    """Loads the repository handler plugin class with the given entrypoint *name*. The result is cached, so repeated
+    repositories in the same process only scan the entrypoints once."""
+
+    return load_entrypoint(RepositoryHandlerPlugin, name)  # type: ignore[type-abstract]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_handler() -> RepositoryHandlerPlugin:
+    """Returns the shared instance of the default repository handler. Repository handlers are stateless, thus one
+    instance can serve all repositories."""
+
+    # Imported locally because the default handler module imports this module.
+    from slap.ext.repository_handlers.default import DefaultRepositoryHandler
+
+    return DefaultRepositoryHandler()
+
 
 class Repository(Configuration):
     """A repository represents a directory that contains one or more projects. A repository represents one or more
     projects in one logical unit, usually tracked by a single version control repository. The class"""
 
-    handler: Once[RepositoryHandlerPlugin]
-
-    def __init__(self, directory: Path) -> None:
-        super().__init__(directory)
-        self._handler = Once(self._get_repository_handler)
-        self.projects = Once(self._get_projects)
-        self.vcs = Once(self._get_vcs)
-        self.host = Once(self._get_repository_host)
-
     @property
     def id(self) -> str:  # type: ignore[override]
         return "/"
 
-    @property
+    @once_property
     def is_monorepo(self) -> bool:
-        if len(self.projects()) > 1 or (len(self.projects()) == 1 and self.projects()[0].directory != self.directory):
-            return True
-        return False
+        """Whether the repository contains more than one project, or a single project that is not in the repository's
+        root directory. Computed once, as the projects of a repository are resolved only once."""
+
+        projects = self.projects
+        return len(projects) > 1 or (len(projects) == 1 and projects[0].directory != self.directory)
 
     @property
     def use_shared_venv(self) -> bool:
@@ -99,63 +130,87 @@ class Repository(Configuration):
 
         return True
 
-    def _get_repository_handler(self) -> RepositoryHandlerPlugin | None:
+    @once_property
+    def _handler(self) -> RepositoryHandlerPlugin | None:
         """Returns the handler for this repository."""
 
-        from slap.ext.repository_handlers.default import DefaultRepositoryHandler
-        from slap.plugins import RepositoryHandlerPlugin
-        from slap.util.plugins import load_entrypoint
-
         handler: RepositoryHandlerPlugin
-        handler_name = self.raw_config().get("repository", {}).get("handler")
+        handler_name = (self.raw_config().get("repository") or {}).get("handler")
         if handler_name is None:
-            handler = DefaultRepositoryHandler()
+            handler = _get_default_handler()
             if not handler.matches_repository(self):
                 return None
         else:
-            assert isinstance(handler_name, str), repr(handler_name)
-            handler = load_entrypoint(RepositoryHandlerPlugin, handler_name)()  # type: ignore[type-abstract]
-            assert handler.matches_repository(self), (self, handler)
+            if not isinstance(handler_name, str):
+                raise TypeError(f"repository.handler must be a str, got {type(handler_name).__name__}")
+            handler = _resolve_handler_cls(handler_name)()
+            if __debug__ and not handler.matches_repository(self):
+                raise RuntimeError(f"repository handler {handler_name!r} does not match {self}")
         return handler
 
-    def _get_projects(self) -> list[Project]:
-        """Returns the projects provided by the project handler, but sorted in topological order."""
+    @once_property
+    def projects(self) -> list[Project]:
+        """Returns the projects provided by the project handler, sorted by their ID."""
 
-        handler = self._handler()
+        handler = self._handler
         if not handler:
             return []
 
         return sorted(handler.get_projects(self), key=lambda p: p.id)
 
     def get_projects_ordered(self) -> list[Project]:
-        """Return a topological ordering of the projects."""
+        """Return a topological ordering of the projects. Whenever multiple projects have all their dependencies
+        satisfied, the one with the smallest ID comes first.
 
-        from slap.project import Project
-        from slap.util.digraph import DiGraph, topological_sort
+        Raises:
+          RuntimeError: If there is a cycle in the project interdependencies.
+        """
 
-        graph: DiGraph[Project, None, None] = DiGraph()
-        projects = self.projects()
-        for project in projects:
-            assert isinstance(project, Project)
-            graph.add_node(project, None)
-            for dep in project.get_interdependencies(projects):
-                graph.add_node(dep, None)
-                graph.add_edge(dep, project, None)
+        from slap.project import get_projects_by_dist_name
 
-        return list(topological_sort(graph, sorting_key=lambda p: p.id))
+        projects = self.projects
+        projects_by_dist_name = get_projects_by_dist_name(projects)
+        sorter: graphlib.TopologicalSorter[Project] = graphlib.TopologicalSorter()
+        for project in projects:
+            sorter.add(project, *project.get_interdependencies(projects_by_dist_name))
+
+        try:
+            sorter.prepare()
+        except graphlib.CycleError as exc:
+            raise RuntimeError(f"encountered a cycle in the project interdependencies ({exc.args[1]})") from exc
+
+        # The projects are already sorted by their ID, so their position is a cheap key to always emit the ready
+        # project with the smallest ID first.
+        positions = {project: index for index, project in enumerate(projects)}
+        ready: list[int] = []
+        result: list[Project] = []
+        while sorter.is_active():
+            for project in sorter.get_ready():
+                heapq.heappush(ready, positions[project])
+            project = projects[heapq.heappop(ready)]
+            result.append(project)
+            sorter.done(project)
+
+        return result
+
+    @once_property
+    def vcs(self) -> Vcs | None:
+        """Returns the version control system of the repository, if any."""
 
-    def _get_vcs(self) -> Vcs | None:
         from nr.stream import Optional
 
-        return Optional(self._handler()).map(lambda h: h.get_vcs(self)).or_else(None)
+        return Optional(self._handler).map(lambda h: h.get_vcs(self)).or_else(None)
+
+    @once_property
+    def host(self) -> RepositoryHost | None:
+        """Returns the hosting service of the repository, if any."""
 
-    def _get_repository_host(self) -> RepositoryHost | None:
         from nr.stream import Optional
 
-        return Optional(self._handler()).map(lambda h: h.get_repository_host(self)).or_else(None)
+        return Optional(self._handler).map(lambda h: h.get_repository_host(self)).or_else(None)
 
     def get_project_by_directory(self, directory: Path) -> Project:
-        for project in self.projects():
+        for project in self.projects:
             if project.directory == directory:
                 return project
         raise ValueError(f"no project found for directory {directory}")
@@ -9,7 +9,6 @@ from __future__ import annotations
 import dataclasses
 import typing as t
 
-import requests
 from databind.core.settings import Alias
 
 
@@ -27,6 +26,7 @@ class SpdxLicense:
 
     def get_details(self) -> SpdxLicenseDetails:
         import databind.json
+        import requests
 
         response = requests.get(self.details_url)
         response.raise_for_status()
@@ -79,6 +79,7 @@ def get_spdx_licenses() -> dict[str, SpdxLicense]:
     """Returns a dictionary of all SPDX licenses, keyed by the license ID."""
 
     import databind.json
+    import requests
 
     url = "https://raw.githubusercontent.com/spdx/license-list-data/master/json/licenses.json"
     response = requests.get(url)
@@ -91,6 +92,7 @@ def get_spdx_license_details(license_id: str) -> SpdxLicenseDetails:
     """Returns the details for a single SPDX license."""
 
     import databind.json
+    import requests
 
     url = f"https://spdx.org/licenses/{license_id}.json"
     response = requests.get(url)
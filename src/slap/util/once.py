@@ -4,6 +4,8 @@ import typing as t
 
 from .supplier import Supplier, T_co
 
+T = t.TypeVar("T")
+
 
 class Once(t.Generic[T_co]):
     def __init__(self, supplier: Supplier[T_co]) -> None:
@@ -30,3 +32,30 @@ class Once(t.Generic[T_co]):
         if resupply:
             self._cached = False
         return self()
+
+
+class once_property(t.Generic[T]):
+    """A lock-free alternative to #functools.cached_property (which holds a lock on every first access before
+    Python 3.12). The value is computed on first access and stored in the instance `__dict__` under the same name.
+    As this is a non-data descriptor, the stored value shadows the descriptor for all subsequent accesses."""
+
+    def __init__(self, func: t.Callable[[t.Any], T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @t.overload
+    def __get__(self, instance: None, owner: type | None = None) -> once_property[T]: ...
+
+    @t.overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> once_property[T] | T:
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
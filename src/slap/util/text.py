@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 import typing as t
 
 T = t.TypeVar("T")
@@ -16,7 +15,7 @@ def substitute_ranges(text: str, ranges: t.Iterable[SubstRange], is_sorted: bool
     if not is_sorted:
         ranges = sorted(ranges, key=lambda x: x[0])
 
-    out = io.StringIO()
+    parts: list[str] = []
     max_end_index = 0
     for index, (istart, iend, subst) in enumerate(ranges):
         if iend < istart:
@@ -24,13 +23,12 @@ def substitute_ranges(text: str, ranges: t.Iterable[SubstRange], is_sorted: bool
         if istart < max_end_index:
             raise ValueError(f"invalid range at index {index}: overlap with previous range")
 
-        subst = str(subst)
-        out.write(text[max_end_index:istart])
-        out.write(subst)
+        parts.append(text[max_end_index:istart])
+        parts.append(str(subst))
         max_end_index = iend
 
-    out.write(text[max_end_index:])
-    return out.getvalue()
+    parts.append(text[max_end_index:])
+    return "".join(parts)
 
 
 def longest_common_substring(
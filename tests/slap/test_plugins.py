@@ -0,0 +1,12 @@
+import pytest
+
+from slap.ext.repository_handlers.default import DefaultRepositoryHandler
+from slap.ext.version_incrementing_rule import major, patch
+from slap.plugins import RepositoryHandlerPlugin, VersionIncrementingRulePlugin
+
+
+@pytest.mark.parametrize("plugin", [DefaultRepositoryHandler(), major(), patch()])
+def test__builtin_stateless_plugins__have_no_instance_dict(
+    plugin: RepositoryHandlerPlugin | VersionIncrementingRulePlugin,
+) -> None:
+    assert not hasattr(plugin, "__dict__")
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+from slap.repository import Repository, _get_repository_host_loaders
+
+
+def _write_poetry_project(directory: Path, name: str, dependencies: list[str]) -> None:
+    directory.mkdir(parents=True)
+    lines = [
+        "[build-system]",
+        'requires = ["poetry-core"]',
+        'build-backend = "poetry.core.masonry.api"',
+        "",
+        "[tool.poetry]",
+        f'name = "{name}"',
+        'version = "1.0.0"',
+        "",
+        "[tool.poetry.dependencies]",
+        'python = "^3.10"',
+        *(f'{dep} = "^1.0.0"' for dep in dependencies),
+    ]
+    (directory / "pyproject.toml").write_text("\n".join(lines) + "\n")
+
+
+def _make_repository(directory: Path, projects: dict[str, list[str]]) -> Repository:
+    (directory / "slap.toml").write_text("")
+    for name, dependencies in projects.items():
+        _write_poetry_project(directory / name, name, dependencies)
+    return Repository(directory)
+
+
+def test__Repository__get_projects_ordered__dependencies_come_first(tmp_path: Path) -> None:
+    repository = _make_repository(tmp_path, {"a": ["b", "c"], "b": ["c"], "c": [], "d": []})
+    assert [p.id for p in repository.get_projects_ordered()] == ["c", "b", "a", "d"]
+
+
+def test__Repository__get_projects_ordered__raises_on_cycle(tmp_path: Path) -> None:
+    repository = _make_repository(tmp_path, {"a": ["b"], "b": ["a"], "c": []})
+    with pytest.raises(RuntimeError):
+        repository.get_projects_ordered()
+
+
+def test__Repository__get_projects_ordered__sees_added_interdependencies(tmp_path: Path) -> None:
+    from slap.python.dependency import parse_dependency_string
+
+    repository = _make_repository(tmp_path, {"a": [], "b": []})
+    assert [p.id for p in repository.get_projects_ordered()] == ["a", "b"]
+    repository.get_project_by_directory(tmp_path / "a").add_dependency(parse_dependency_string("b>=1.0.0"), "run")
+    assert [p.id for p in repository.get_projects_ordered()] == ["b", "a"]
+
+
+def test__Project__get_interdependencies__recursive_expands_each_project_once(tmp_path: Path) -> None:
+    repository = _make_repository(tmp_path, {"a": ["b", "c"], "b": ["c", "d"], "c": ["d"], "d": []})
+    project = repository.get_project_by_directory(tmp_path / "a")
+    assert [p.id for p in project.get_interdependencies(repository.projects, recursive=True)] == ["b", "c", "d"]
+
+
+def test__Project__get_interdependencies__recursive_terminates_on_cycle(tmp_path: Path) -> None:
+    repository = _make_repository(tmp_path, {"a": ["b"], "b": ["a"]})
+    project = repository.get_project_by_directory(tmp_path / "a")
+    assert [p.id for p in project.get_interdependencies(repository.projects, recursive=True)] == ["b"]
+
+
+def test__Repository__host__does_not_load_host_plugins_after_a_match(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    host = object()
+
+    class MatchingHost:
+        @staticmethod
+        def detect_repository_host(repository: Repository) -> object:
+            return host
+
+    def _load_broken_host() -> type:
+        raise ImportError("broken repository host plugin")
+
+    entrypoints = [("matching", lambda: MatchingHost), ("broken", _load_broken_host)]
+    monkeypatch.setattr("slap.repository.iter_entrypoints", lambda group: iter(entrypoints))
+    _get_repository_host_loaders.cache_clear()
+    try:
+        repository = _make_repository(tmp_path, {"a": []})
+        assert repository.host is host
+    finally:
+        _get_repository_host_loaders.cache_clear()